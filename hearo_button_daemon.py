@@ -20,18 +20,27 @@ No extra functionality beyond the spec.
 """
 
 import argparse
+import itertools
 import json
 import logging
 import os
+import selectors
 import signal
 import socket
 import sys
 import time
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Any, Dict, Optional, Tuple
+from datetime import timedelta
+from typing import Any, Dict, List, Optional, Tuple
 
 import gpiod
-from gpiod.line import Direction, Bias, Value  # libgpiod 2.x enums 
+from gpiod.line import Direction, Bias, Clock, Edge, Value  # libgpiod 2.x enums 
+
+try:
+    import orjson  # optional: faster IPC (de)serialisation
+except ImportError:
+    orjson = None
 
 
 # ------------------------------
@@ -42,13 +51,19 @@ EVENT_SOCKET_PATH = "/tmp/hearo/events.sock"
 CMD_SOCKET_PATH = "/tmp/hearo/bd.sock"
 
 # Timing (ms) :contentReference[oaicite:5]{index=5}
-DEBOUNCE_MS = 30
+DEBOUNCE_MS = 10  # applied in-kernel via LineSettings.debounce_period
 SHORT_MIN_MS = 50
 LONG_THRESHOLD_MS = 800
 RESET_LONG_THRESHOLD_MS = 5000
 HOLD_TICK_INTERVAL_MS = 250
 
-POLL_INTERVAL_MS = 10  # main loop poll period
+GPIO_ERROR_RETRY_MS = 1000  # GPIO fd is left unwatched this long after a read error
+
+# IPC socket reuse
+RECONNECT_MIN_MS = 100  # backoff after the event socket peer is missing
+RECONNECT_MAX_MS = 2000
+REPLY_SOCK_CACHE_SIZE = 4  # connected reply sockets kept per CommandServer
+CMD_DRAIN_MAX = 32  # commands handled per wakeup of the cmd socket
 
 # GPIO mapping (BCM) :contentReference[oaicite:6]{index=6}
 BUTTON_PINS = {
@@ -65,18 +80,46 @@ BUTTON_PINS = {
 # ------------------------------
 
 def epoch_ms() -> int:
-    return int(time.time() * 1000)
+    """Wall-clock ms, only for envelope "ts" fields."""
+    return time.time_ns() // 1_000_000
+
+
+def mono_ms() -> int:
+    """Monotonic ms for all FSM timing; immune to NTP steps after boot."""
+    return time.monotonic_ns() // 1_000_000
+
+
+if orjson is not None:
+    def json_bytes(msg: Dict[str, Any]) -> bytes:
+        return orjson.dumps(msg)
+
+    json_loads = orjson.loads
+else:
+    def json_bytes(msg: Dict[str, Any]) -> bytes:
+        return json.dumps(msg, separators=(",", ":")).encode("utf-8")
+
+    def json_loads(data: Any) -> Any:
+        # stdlib json cannot parse a memoryview directly
+        return json.loads(bytes(data))
+
+
+# Cached logging.DEBUG check for the button FSM; see refresh_debug_flag()
+_debug_enabled = False
 
 
-_event_counter = 0
-_ack_counter = 0
-_res_counter = 0
+def refresh_debug_flag() -> None:
+    global _debug_enabled
+    _debug_enabled = logging.getLogger().isEnabledFor(logging.DEBUG)
+
+
+# Envelope id counters (1, 2, 3, ...)
+_next_event_num = itertools.count(1).__next__
+_next_ack_num = itertools.count(1).__next__
+_next_res_num = itertools.count(1).__next__
 
 
 def _next_event_id() -> str:
-    global _event_counter
-    _event_counter += 1
-    return f"e-bd-{_event_counter}"
+    return f"e-bd-{_next_event_num()}"
 
 
 def make_event_envelope(event: str, payload: Dict[str, Any]) -> Dict[str, Any]:
@@ -90,13 +133,30 @@ def make_event_envelope(event: str, payload: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
+def make_button_event_templates(name: str) -> Dict[str, bytes]:
+    """
+    Pre-encode the BD_EVENT_BUTTON envelope for one button, one template per
+    interaction. Only id number, ts, duration_ms and sequence are left as
+    %d fields; the output matches json.dumps(make_event_envelope(...)).
+    """
+    templates: Dict[str, bytes] = {}
+    for interaction in ("SHORT_PRESS", "LONG_PRESS", "HOLD_TICK"):
+        templates[interaction] = (
+            '{"schema":"hearo.ipc/event","v":1,"id":"e-bd-%d","ts":%d,'
+            '"event":"BD_EVENT_BUTTON","payload":{"button":'
+            + json.dumps(name).replace("%", "%%")
+            + ',"interaction":'
+            + json.dumps(interaction).replace("%", "%%")
+            + ',"duration_ms":%d,"sequence":%d}}'
+        ).encode("utf-8")
+    return templates
+
+
 def make_ack_envelope(cmd_id: str, ok: bool, error: Optional[str] = None) -> Dict[str, Any]:
-    global _ack_counter
-    _ack_counter += 1
     return {
         "schema": "hearo.ipc/ack",
         "v": 1,
-        "id": f"ack-bd-{_ack_counter}",
+        "id": f"ack-bd-{_next_ack_num()}",
         "ts": epoch_ms(),
         "corr": cmd_id,
         "ok": bool(ok),
@@ -105,12 +165,10 @@ def make_ack_envelope(cmd_id: str, ok: bool, error: Optional[str] = None) -> Dic
 
 
 def make_result_envelope(cmd_id: str, ok: bool, payload: Dict[str, Any]) -> Dict[str, Any]:
-    global _res_counter
-    _res_counter += 1
     return {
         "schema": "hearo.ipc/result",
         "v": 1,
-        "id": f"res-bd-{_res_counter}",
+        "id": f"res-bd-{_next_res_num()}",
         "ts": epoch_ms(),
         "corr": cmd_id,
         "ok": bool(ok),
@@ -123,19 +181,108 @@ def make_result_envelope(cmd_id: str, ok: bool, payload: Dict[str, Any]) -> Dict
 # ------------------------------
 
 class EventSender:
-    """Thin wrapper around a Unix datagram socket used to send events."""
+    """
+    Thin wrapper around a Unix datagram socket used to send events.
+
+    The socket is connected once to the HCSM event path and kept for the
+    daemon lifetime; it is non-blocking so a stalled consumer can never
+    block the button loop. If the peer goes away (e.g. HCSM restarts and
+    rebinds its socket) the connection is dropped and re-established on
+    the next send; while the peer is missing, connect attempts back off
+    exponentially up to RECONNECT_MAX_MS and only the first failure is
+    logged as a warning. While the peer is down, ctx["last_error_code"]
+    (if a ctx is given) reads EVENT_SOCK_UNAVAILABLE for PING.
+    """
 
-    def __init__(self, path: str) -> None:
+    def __init__(self, path: str, ctx: Optional[Dict[str, Any]] = None) -> None:
         self.path = path
+        self.ctx = ctx
+        self.sock: Optional[socket.socket] = None
+        self._retry_at_ms = 0
+        self._retry_delay_ms = RECONNECT_MIN_MS
+        self._peer_down = False
+
+    def _connect(self) -> None:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        sock.setblocking(False)
+        try:
+            sock.connect(self.path)
+        except OSError:
+            sock.close()
+            raise
+        self.sock = sock
+        self._retry_delay_ms = RECONNECT_MIN_MS
+        if self._peer_down:
+            self._peer_down = False
+            logging.info("BD: event socket %s reachable again", self.path)
+            if self.ctx is not None and self.ctx.get("last_error_code") == "EVENT_SOCK_UNAVAILABLE":
+                self.ctx["last_error_code"] = None
+
+    def _peer_unavailable(self, e: OSError) -> None:
+        if self._peer_down:
+            logging.debug("BD: event socket %s still unavailable: %s", self.path, e)
+        else:
+            self._peer_down = True
+            logging.warning(
+                "BD: event socket %s unavailable, dropping events until it is back: %s",
+                self.path,
+                e,
+            )
+            if self.ctx is not None:
+                self.ctx["last_error_code"] = "EVENT_SOCK_UNAVAILABLE"
+        self._retry_at_ms = mono_ms() + self._retry_delay_ms
+        self._retry_delay_ms = min(self._retry_delay_ms * 2, RECONNECT_MAX_MS)
 
-    def send(self, msg: Dict[str, Any]) -> None:
-        data = json.dumps(msg, separators=(",", ":")).encode("utf-8")
+    def probe(self) -> bool:
+        """
+        Connect now rather than on the first event, so a missing consumer
+        is reported at startup. Returns False if the peer is not up.
+        """
+        if self.sock is not None:
+            return True
         try:
-            with socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM) as s:
-                s.connect(self.path)
-                s.send(data)
+            self._connect()
         except OSError as e:
-            logging.warning("BD: failed to send event to %s: %s", self.path, e)
+            self._peer_unavailable(e)
+            # A one-off check: don't hold back the first real event
+            self._retry_at_ms = 0
+            self._retry_delay_ms = RECONNECT_MIN_MS
+            return False
+        return True
+
+    def send(self, msg: Dict[str, Any]) -> None:
+        self.send_raw(json_bytes(msg))
+
+    def send_raw(self, data: bytes) -> None:
+        while True:
+            fresh = self.sock is None
+            if fresh and mono_ms() < self._retry_at_ms:
+                return
+            try:
+                if fresh:
+                    self._connect()
+                self.sock.send(data)
+                return
+            except BlockingIOError:
+                logging.warning(
+                    "BD: event queue at %s full, dropping event", self.path
+                )
+                return
+            except OSError as e:
+                self.close()
+                if fresh:
+                    self._peer_unavailable(e)
+                    return
+                # stale connection (peer rebound its socket): retry once
+
+    def close(self) -> None:
+        if self.sock is None:
+            return
+        try:
+            self.sock.close()
+        except Exception:
+            pass
+        self.sock = None
 
 
 # ------------------------------
@@ -144,32 +291,61 @@ class EventSender:
 
 class ButtonState:
     """
-    Per-button debouncing and interaction classification.
+    Per-button interaction classification.
 
     Implements states:
       IDLE -> PRESSED -> LONG_HELD -> IDLE
-    (release debounced via stable duration)
+    (edges are debounced in the kernel, see setup_gpio)
     """
 
-    STATE_IDLE = "IDLE"
-    STATE_PRESSED = "PRESSED"
-    STATE_LONG_HELD = "LONG_HELD"
+    # Small ints so update() can index its handler table directly
+    STATE_IDLE = 0
+    STATE_PRESSED = 1
+    STATE_LONG_HELD = 2
+
+    __slots__ = (
+        "name",
+        "offset",
+        "is_reset",
+        "long_threshold_ms",
+        "last_level",
+        "state",
+        "t_press_start_ms",
+        "t_last_hold_tick_ms",
+        "sequence_counter",
+        "_event_templates",
+        "_last_button",
+        "_hold_ticks",
+    )
 
     def __init__(self, name: str, offset: int, is_reset: bool = False) -> None:
         self.name = name
         self.offset = offset
         self.is_reset = is_reset
+        self.long_threshold_ms = (
+            RESET_LONG_THRESHOLD_MS if is_reset else LONG_THRESHOLD_MS
+        )
 
         # raw logical level: 1 = released, 0 = pressed
         self.last_level = 1
         self.state = self.STATE_IDLE
 
-        self.t_last_change_ms = epoch_ms()
         self.t_press_start_ms = 0
         self.t_last_hold_tick_ms = 0
 
         self.sequence_counter = 0
 
+        self._event_templates = make_button_event_templates(name)
+        # Reused for bd_context["last_button"]; only read when answering PING
+        self._last_button: Dict[str, Any] = {
+            "button": name,
+            "interaction": None,
+            "duration_ms": 0,
+            "sequence": 0,
+            "hold_ticks": 0,
+        }
+        self._hold_ticks = 0  # HOLD_TICKs emitted during the current press
+
     def _next_sequence(self) -> int:
         self.sequence_counter += 1
         return self.sequence_counter
@@ -182,22 +358,35 @@ class ButtonState:
         bd_context: Dict[str, Any],
     ) -> None:
         seq = self._next_sequence()
-        payload = {
-            "button": self.name,
-            "interaction": interaction,
-            "duration_ms": duration_ms,
-            "sequence": seq,
-        }
-        event = make_event_envelope("BD_EVENT_BUTTON", payload)
-        sender.send(event)
-        bd_context["last_button"] = payload
-        logging.info(
-            "BD: BUTTON %s %s duration=%dms seq=%d",
-            self.name,
-            interaction,
-            duration_ms,
-            seq,
+        sender.send_raw(
+            self._event_templates[interaction]
+            % (_next_event_num(), epoch_ms(), duration_ms, seq)
         )
+        if interaction != "HOLD_TICK":
+            # last_button only records completed presses
+            last = self._last_button
+            last["interaction"] = interaction
+            last["duration_ms"] = duration_ms
+            last["sequence"] = seq
+            last["hold_ticks"] = self._hold_ticks
+            bd_context["last_button"] = last
+            logging.info(
+                "BD: BUTTON %s %s duration=%dms seq=%d",
+                self.name,
+                interaction,
+                duration_ms,
+                seq,
+            )
+        else:
+            self._hold_ticks += 1
+            # 4/s while a button is held; keep them out of the INFO log
+            if _debug_enabled:
+                logging.debug(
+                    "BD: BUTTON %s HOLD_TICK duration=%dms seq=%d",
+                    self.name,
+                    duration_ms,
+                    seq,
+                )
 
     def update(
         self,
@@ -207,94 +396,130 @@ class ButtonState:
         bd_context: Dict[str, Any],
     ) -> None:
         """
-        Poll function called from main loop.
+        Called from the main loop for every edge of this button and again
+        whenever next_deadline_ms() has passed.
 
-        current_level: 1=released, 0=pressed (logical, after mapping from gpiod.Value).
+        current_level: 1=released, 0=pressed. Edges arrive already debounced
+        by the kernel (debounce_period), so levels are taken as stable.
         """
-        # Edge detection with debounce
-        if current_level != self.last_level:
-            self.t_last_change_ms = now_ms
-            self.last_level = current_level
-
-        stable_duration = now_ms - self.t_last_change_ms
-
-        if self.state == self.STATE_IDLE:
-            if current_level == 0 and stable_duration >= DEBOUNCE_MS:
-                # Confirmed press
-                self.state = self.STATE_PRESSED
-                self.t_press_start_ms = now_ms
-                self.t_last_hold_tick_ms = now_ms
-                logging.debug("BD: %s -> PRESSED", self.name)
+        self.last_level = current_level
+        self._STATE_HANDLERS[self.state](
+            self, now_ms, current_level, sender, bd_context
+        )
 
-        elif self.state == self.STATE_PRESSED:
-            press_duration = now_ms - self.t_press_start_ms
+    def _on_idle(
+        self,
+        now_ms: int,
+        current_level: int,
+        sender: EventSender,
+        bd_context: Dict[str, Any],
+    ) -> None:
+        if current_level == 0:
+            self.state = self.STATE_PRESSED
+            self.t_press_start_ms = now_ms
+            self.t_last_hold_tick_ms = now_ms
+            self._hold_ticks = 0
+            if _debug_enabled:
+                logging.debug("BD: %s -> PRESSED", self.name)
 
-            if current_level == 1 and stable_duration >= DEBOUNCE_MS:
-                # Released before long threshold -> candidate SHORT_PRESS
-                if SHORT_MIN_MS <= press_duration < (
-                    RESET_LONG_THRESHOLD_MS if self.is_reset else LONG_THRESHOLD_MS
-                ):
-                    self._emit_button_event(
-                        sender,
-                        interaction="SHORT_PRESS",
-                        duration_ms=press_duration,
-                        bd_context=bd_context,
-                    )
-                # else: ignore too-short noise
-                self.state = self.STATE_IDLE
+    def _on_pressed(
+        self,
+        now_ms: int,
+        current_level: int,
+        sender: EventSender,
+        bd_context: Dict[str, Any],
+    ) -> None:
+        press_duration = now_ms - self.t_press_start_ms
+        threshold = self.long_threshold_ms
+
+        if current_level == 1:
+            if press_duration >= threshold:
+                # Released in the same wakeup the threshold expired
+                self._emit_button_event(
+                    sender,
+                    interaction="LONG_PRESS",
+                    duration_ms=press_duration,
+                    bd_context=bd_context,
+                )
+            elif press_duration >= SHORT_MIN_MS:
+                self._emit_button_event(
+                    sender,
+                    interaction="SHORT_PRESS",
+                    duration_ms=press_duration,
+                    bd_context=bd_context,
+                )
+            # else: ignore too-short noise
+            self.state = self.STATE_IDLE
+            if _debug_enabled:
                 logging.debug(
                     "BD: %s -> IDLE (release, dur=%d ms)", self.name, press_duration
                 )
 
-            else:
-                threshold = (
-                    RESET_LONG_THRESHOLD_MS if self.is_reset else LONG_THRESHOLD_MS
+        elif press_duration >= threshold:
+            self.state = self.STATE_LONG_HELD
+            if _debug_enabled:
+                logging.debug("BD: %s -> LONG_HELD", self.name)
+
+    def _on_long_held(
+        self,
+        now_ms: int,
+        current_level: int,
+        sender: EventSender,
+        bd_context: Dict[str, Any],
+    ) -> None:
+        press_duration = now_ms - self.t_press_start_ms
+
+        # HOLD_TICKs while still pressed
+        if current_level == 0:
+            if now_ms - self.t_last_hold_tick_ms >= HOLD_TICK_INTERVAL_MS:
+                self.t_last_hold_tick_ms = now_ms
+                self._emit_button_event(
+                    sender,
+                    interaction="HOLD_TICK",
+                    duration_ms=press_duration,
+                    bd_context=bd_context,
                 )
-                if press_duration >= threshold:
-                    self.state = self.STATE_LONG_HELD
-                    logging.debug("BD: %s -> LONG_HELD", self.name)
-
-        elif self.state == self.STATE_LONG_HELD:
-            press_duration = now_ms - self.t_press_start_ms
-
-            # HOLD_TICKs while still pressed
-            if current_level == 0:
-                if now_ms - self.t_last_hold_tick_ms >= HOLD_TICK_INTERVAL_MS:
-                    self.t_last_hold_tick_ms = now_ms
-                    self._emit_button_event(
-                        sender,
-                        interaction="HOLD_TICK",
-                        duration_ms=press_duration,
-                        bd_context=bd_context,
-                    )
-            # Release after long hold -> LONG_PRESS
-            elif current_level == 1 and stable_duration >= DEBOUNCE_MS:
-                threshold = (
-                    RESET_LONG_THRESHOLD_MS if self.is_reset else LONG_THRESHOLD_MS
+        # Release after long hold -> LONG_PRESS. The edge timestamp can
+        # predate the timer pass that entered LONG_HELD, so re-check it.
+        else:
+            if press_duration >= self.long_threshold_ms:
+                self._emit_button_event(
+                    sender,
+                    interaction="LONG_PRESS",
+                    duration_ms=press_duration,
+                    bd_context=bd_context,
                 )
-                if press_duration >= threshold:
-                    self._emit_button_event(
-                        sender,
-                        interaction="LONG_PRESS",
-                        duration_ms=press_duration,
-                        bd_context=bd_context,
-                    )
-                else:
-                    # fallback: still treat as SHORT_PRESS if above min
-                    if press_duration >= SHORT_MIN_MS:
-                        self._emit_button_event(
-                            sender,
-                            interaction="SHORT_PRESS",
-                            duration_ms=press_duration,
-                            bd_context=bd_context,
-                        )
-                self.state = self.STATE_IDLE
+            elif press_duration >= SHORT_MIN_MS:
+                self._emit_button_event(
+                    sender,
+                    interaction="SHORT_PRESS",
+                    duration_ms=press_duration,
+                    bd_context=bd_context,
+                )
+            self.state = self.STATE_IDLE
+            if _debug_enabled:
                 logging.debug(
                     "BD: %s -> IDLE (release after LONG_HELD, dur=%d ms)",
                     self.name,
                     press_duration,
                 )
 
+    # Indexed by STATE_* value
+    _STATE_HANDLERS = (_on_idle, _on_pressed, _on_long_held)
+
+    def next_deadline_ms(self) -> Optional[int]:
+        """
+        Earliest time at which update() can change state without a new edge:
+        long threshold or next HOLD_TICK. None if idle.
+        """
+        if self.state == self.STATE_PRESSED:
+            return self.t_press_start_ms + self.long_threshold_ms
+
+        if self.state == self.STATE_LONG_HELD:
+            return self.t_last_hold_tick_ms + HOLD_TICK_INTERVAL_MS
+
+        return None
+
 
 # ------------------------------
 # Command server
@@ -322,9 +547,21 @@ class CommandServer:
 
         self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
         self.sock.bind(self.path)
-        self.sock.settimeout(0.1)
+        self.sock.setblocking(False)
+
+        # Reused receive buffer; commands are parsed straight from the view
+        self._buf = bytearray(4096)
+        self._view = memoryview(self._buf)
+
+        # Connected reply sockets by reply path, least recently used first
+        self._reply_socks: "OrderedDict[str, socket.socket]" = OrderedDict()
+
+    def fileno(self) -> int:
+        return self.sock.fileno()
 
     def close(self) -> None:
+        for reply_path in list(self._reply_socks):
+            self._drop_reply_sock(reply_path)
         try:
             self.sock.close()
         except Exception:
@@ -334,14 +571,48 @@ class CommandServer:
         except FileNotFoundError:
             pass
 
+    def _drop_reply_sock(self, reply_path: str) -> None:
+        s = self._reply_socks.pop(reply_path, None)
+        if s is not None:
+            try:
+                s.close()
+            except Exception:
+                pass
+
     def _send_reply(self, reply_path: str, msg: Dict[str, Any]) -> None:
-        data = json.dumps(msg, separators=(",", ":")).encode("utf-8")
-        try:
-            with socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM) as s:
-                s.connect(reply_path)
+        """
+        Send a reply datagram over a cached connected socket. Callers
+        usually ACK and RESULT to the same reply path, and clients such as
+        HCSM reuse theirs, so the socket is kept (LRU-bounded) instead of
+        being created per reply. A stale cached socket is retried once.
+        """
+        data = json_bytes(msg)
+        while True:
+            s = self._reply_socks.get(reply_path)
+            fresh = s is None
+            try:
+                if fresh:
+                    s = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+                    s.setblocking(False)
+                    self._reply_socks[reply_path] = s
+                    if len(self._reply_socks) > REPLY_SOCK_CACHE_SIZE:
+                        self._drop_reply_sock(next(iter(self._reply_socks)))
+                    s.connect(reply_path)
+                else:
+                    self._reply_socks.move_to_end(reply_path)
                 s.send(data)
-        except OSError as e:
-            logging.warning("BD: failed to send reply to %s: %s", reply_path, e)
+                return
+            except BlockingIOError:
+                # Client is not reading its replies; never stall the loop
+                logging.warning("BD: reply queue at %s full, dropping reply", reply_path)
+                return
+            except OSError as e:
+                self._drop_reply_sock(reply_path)
+                if fresh:
+                    logging.warning(
+                        "BD: failed to send reply to %s: %s", reply_path, e
+                    )
+                    return
 
     def _handle_cmd_ping(self, cmd: Dict[str, Any], reply: str) -> None:
         cmd_id = cmd.get("id", "")
@@ -352,7 +623,7 @@ class CommandServer:
             "status": self.ctx.get("status", "ready"),
             "last_button": self.ctx.get("last_button"),
             "last_error_code": self.ctx.get("last_error_code"),
-            "uptime_ms": epoch_ms() - self.ctx.get("start_time_ms", epoch_ms()),
+            "uptime_ms": mono_ms() - self.ctx.get("start_time_ms", mono_ms()),
         }
         res = make_result_envelope(cmd_id, ok=True, payload=result_payload)
         self._send_reply(reply, res)
@@ -373,6 +644,7 @@ class CommandServer:
             return
 
         logging.getLogger().setLevel(mapping[level])
+        refresh_debug_flag()
         ack = make_ack_envelope(cmd_id, ok=True, error=None)
         self._send_reply(reply, ack)
 
@@ -380,18 +652,25 @@ class CommandServer:
         self._send_reply(reply, res)
 
     def poll(self) -> None:
+        """
+        Handle the queued commands (up to CMD_DRAIN_MAX per call, so a
+        command flood cannot starve button handling).
+        """
+        for _ in range(CMD_DRAIN_MAX):
+            try:
+                n = self.sock.recv_into(self._buf)
+            except BlockingIOError:
+                return
+            except OSError as e:
+                logging.error("BD: command socket error: %s", e)
+                self.ctx["last_error_code"] = "CMD_SOCKET_ERROR"
+                return
+            self._handle_datagram(self._view[:n])
+
+    def _handle_datagram(self, data: memoryview) -> None:
         try:
-            data, _addr = self.sock.recvfrom(4096)
-        except socket.timeout:
-            return
-        except OSError as e:
-            logging.error("BD: command socket error: %s", e)
-            self.ctx["last_error_code"] = "CMD_SOCKET_ERROR"
-            return
-
-        try:
-            cmd = json.loads(data.decode("utf-8"))
-        except json.JSONDecodeError:
+            cmd = json_loads(data)
+        except ValueError:
             logging.warning("BD: received invalid JSON on cmd socket")
             return
 
@@ -419,16 +698,19 @@ class CommandServer:
 # libgpiod 2.x GPIO wrapper
 # ------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class GpioRequest:
     request: gpiod.LineRequest
-    idx_map: Dict[str, int]  # button name -> index in get_values() list
+    name_by_offset: Dict[int, str]  # line offset -> button name
 
 
 def setup_gpio() -> GpioRequest:
     """
     Request all button lines as inputs with pull-up, active_low=True,
     using libgpiod 2.x request_lines API.
+
+    Both edges are reported and debounced by the kernel (debounce_period),
+    so userspace only wakes for settled press/release transitions.
     """
     chip_path = "/dev/gpiochip0"
 
@@ -439,6 +721,9 @@ def setup_gpio() -> GpioRequest:
         direction=Direction.INPUT,
         bias=Bias.PULL_UP,
         active_low=True,
+        edge_detection=Edge.BOTH,
+        debounce_period=timedelta(milliseconds=DEBOUNCE_MS),
+        event_clock=Clock.MONOTONIC,  # same clock as mono_ms()
     )
 
     config = {
@@ -451,34 +736,46 @@ def setup_gpio() -> GpioRequest:
         config=config,
     )
 
-    # map button name -> index in returned list
-    idx_map: Dict[str, int] = {}
-    for name, offset in BUTTON_PINS.items():
-        idx_map[name] = offsets_order.index(offset)
+    name_by_offset = {offset: name for name, offset in BUTTON_PINS.items()}
 
-    return GpioRequest(request=req, idx_map=idx_map)
+    return GpioRequest(request=req, name_by_offset=name_by_offset)
 
 
 def read_button_levels(gpio_req: GpioRequest) -> Dict[str, int]:
     """
-    Read all button lines and convert to:
+    Read the current level of every button line (1 = released, 0 = pressed).
+    Used to seed the FSMs at startup and to resync held buttons in case an
+    edge was lost. Raises OSError if the read fails.
+    """
+    offsets = list(gpio_req.name_by_offset)
+    values = gpio_req.request.get_values(offsets)
+    return {
+        gpio_req.name_by_offset[offset]: 0 if value == Value.ACTIVE else 1
+        for offset, value in zip(offsets, values)
+    }
+
+
+def read_button_edges(gpio_req: GpioRequest) -> List[Tuple[str, int, int]]:
+    """
+    Read pending edge events and convert to (button name, level, t_ms):
         1 = released
         0 = pressed
+    With active_low=True a rising edge means the button went active.
+    t_ms is the kernel's CLOCK_MONOTONIC edge timestamp, comparable
+    with mono_ms() and free of userspace scheduling delay.
+
+    Raises OSError if the read fails; see ButtonDaemon._handle_gpio_ready.
     """
-    try:
-        raw = gpio_req.request.get_values()  # list[Value]
-    except OSError as e:
-        logging.error("BD: GPIO get_values failed: %s", e)
-        return {name: 1 for name in BUTTON_PINS.keys()}
+    events = gpio_req.request.read_edge_events()
 
-    levels: Dict[str, int] = {}
-    for name, idx in gpio_req.idx_map.items():
-        try:
-            v = raw[idx]
-        except IndexError:
-            v = Value.INACTIVE
-        levels[name] = 0 if v == Value.ACTIVE else 1
-    return levels
+    edges: List[Tuple[str, int, int]] = []
+    for ev in events:
+        name = gpio_req.name_by_offset.get(ev.line_offset)
+        if name is None:
+            continue
+        level = 0 if ev.event_type == gpiod.EdgeEvent.Type.RISING_EDGE else 1
+        edges.append((name, level, ev.timestamp_ns // 1_000_000))
+    return edges
 
 
 # ------------------------------
@@ -488,24 +785,31 @@ def read_button_levels(gpio_req: GpioRequest) -> Dict[str, int]:
 class ButtonDaemon:
     def __init__(self, debug: bool = False) -> None:
         self.debug = debug
-        self.sender = EventSender(EVENT_SOCKET_PATH)
         self.ctx: Dict[str, Any] = {
             "status": "init",
             "last_button": None,
             "last_error_code": None,
-            "start_time_ms": epoch_ms(),
+            "start_time_ms": mono_ms(),
         }
+        self.sender = EventSender(EVENT_SOCKET_PATH, self.ctx)
 
         self.cmd_server: Optional[CommandServer] = None
         self.gpio_req: Optional[GpioRequest] = None
         self.buttons: Dict[str, ButtonState] = {}
 
         self._stopping = False
+        self._sel: Optional[selectors.BaseSelector] = None
+        # Set while the GPIO fd is unregistered after a read error
+        self._gpio_retry_at_ms: Optional[int] = None
 
     def setup(self) -> None:
         # IPC command server
         self.cmd_server = CommandServer(CMD_SOCKET_PATH, self.sender, self.ctx)
 
+        # Report a missing HCSM at startup (sets last_error_code for PING
+        # until the socket is reachable)
+        self.sender.probe()
+
         # GPIO
         try:
             self.gpio_req = setup_gpio()
@@ -528,6 +832,18 @@ class ButtonDaemon:
                 is_reset=(name == "RESET"),
             )
 
+        # A button already held at startup (e.g. RESET through boot) has no
+        # edge to report it; start its press now
+        try:
+            levels = read_button_levels(self.gpio_req)
+        except OSError as e:
+            logging.warning("BD: could not read initial button levels: %s", e)
+        else:
+            now = mono_ms()
+            for name, level in levels.items():
+                if level == 0:
+                    self.buttons[name].update(now, level, self.sender, self.ctx)
+
         self.ctx["status"] = "ready"
 
         # Emit DAEMON_STARTED
@@ -538,29 +854,128 @@ class ButtonDaemon:
     def stop(self) -> None:
         self._stopping = True
 
+    def _handle_gpio_ready(self) -> None:
+        """
+        Feed pending edges into the button FSMs. On a read failure the fd
+        stays readable, so it is taken out of the selector and only watched
+        again after GPIO_ERROR_RETRY_MS (see run()); each failure is
+        reported as BD_EVENT_ERROR.
+        """
+        try:
+            edges = read_button_edges(self.gpio_req)
+        except OSError as e:
+            logging.error("BD: GPIO read_edge_events failed: %s", e)
+            self.ctx["last_error_code"] = "GPIO_READ_FAILED"
+            err_evt = make_event_envelope(
+                "BD_EVENT_ERROR",
+                {"code": "GPIO_READ_FAILED", "message": str(e)},
+            )
+            self.sender.send(err_evt)
+            self._sel.unregister(self.gpio_req.request.fd)
+            self._gpio_retry_at_ms = mono_ms() + GPIO_ERROR_RETRY_MS
+            return
+
+        for name, level, t_ms in edges:
+            self.buttons[name].update(t_ms, level, self.sender, self.ctx)
+
+    def _drain_and_read_levels(self) -> Dict[str, int]:
+        """
+        Called before the timer pass acts on due buttons. Edges still queued
+        in the request are fed in first, so their kernel timestamps classify
+        the press; the line levels read afterwards only correct a button
+        whose edge was actually lost. Returns {} if the levels can't be read.
+        """
+        if self._gpio_retry_at_ms is None:
+            try:
+                pending = self.gpio_req.request.wait_edge_events(timedelta(0))
+            except OSError as e:
+                logging.debug("BD: GPIO edge poll failed: %s", e)
+                pending = False
+            if pending:
+                self._handle_gpio_ready()
+
+        try:
+            return read_button_levels(self.gpio_req)
+        except OSError as e:
+            logging.debug("BD: level resync failed: %s", e)
+            return {}
+
     def run(self) -> None:
         self.setup()
 
         assert self.cmd_server is not None
         assert self.gpio_req is not None
 
-        try:
-            while not self._stopping:
-                now = epoch_ms()
-
-                # Read all button levels
-                levels = read_button_levels(self.gpio_req)
+        # Self-pipe: SIGINT/SIGTERM write a byte here, so a signal ends the
+        # wait at once and the idle wait can be unbounded
+        wake_r, wake_w = os.pipe2(os.O_NONBLOCK | os.O_CLOEXEC)
+        old_wakeup_fd = signal.set_wakeup_fd(wake_w)
 
-                # Update per-button FSM
-                for name, button in self.buttons.items():
-                    level = levels.get(name, 1)
-                    button.update(now, level, self.sender, self.ctx)
+        # One wait over the GPIO request fd (all lines), the cmd socket and
+        # the signal wakeup pipe
+        sel = self._sel = selectors.DefaultSelector()
+        sel.register(self.gpio_req.request.fd, selectors.EVENT_READ, "gpio")
+        sel.register(self.cmd_server.fileno(), selectors.EVENT_READ, "cmd")
+        sel.register(wake_r, selectors.EVENT_READ, "wake")
 
-                # Handle commands
-                self.cmd_server.poll()
-
-                time.sleep(POLL_INTERVAL_MS / 1000.0)
+        timeout_ms: Optional[int] = 0
+        try:
+            while not self._stopping:
+                # Sleep until an edge, a command, a signal or the next
+                # button deadline (forever if no button is pressed)
+                timeout = None if timeout_ms is None else timeout_ms / 1000.0
+                for key, _mask in sel.select(timeout=timeout):
+                    if key.data == "gpio":
+                        self._handle_gpio_ready()
+                    elif key.data == "cmd":
+                        self.cmd_server.poll()
+                    else:
+                        try:
+                            while os.read(wake_r, 64):
+                                pass
+                        except BlockingIOError:
+                            pass
+
+                now = mono_ms()
+
+                # Timer pass: run only buttons whose long threshold / HOLD_TICK
+                # is due, and sleep until the earliest remaining deadline
+                timeout_ms = None
+                levels: Optional[Dict[str, int]] = None
+                if any(
+                    deadline is not None and deadline <= now
+                    for deadline in (b.next_deadline_ms() for b in self.buttons.values())
+                ):
+                    levels = self._drain_and_read_levels()
+                if self._gpio_retry_at_ms is not None:
+                    if self._gpio_retry_at_ms <= now:
+                        self._gpio_retry_at_ms = None
+                        sel.register(self.gpio_req.request.fd, selectors.EVENT_READ, "gpio")
+                    else:
+                        timeout_ms = self._gpio_retry_at_ms - now
+                for button in self.buttons.values():
+                    deadline = button.next_deadline_ms()
+                    if deadline is None:
+                        continue
+                    if deadline <= now:
+                        level = button.last_level
+                        # PRESSED is decided by edge timestamps alone; a line
+                        # found released while LONG_HELD lost its release edge
+                        if levels and button.state == ButtonState.STATE_LONG_HELD:
+                            level = levels.get(button.name, level)
+                        button.update(now, level, self.sender, self.ctx)
+                        deadline = button.next_deadline_ms()
+                        if deadline is None:
+                            continue
+                    wait_ms = max(0, deadline - now)
+                    if timeout_ms is None or wait_ms < timeout_ms:
+                        timeout_ms = wait_ms
         finally:
+            sel.close()
+            signal.set_wakeup_fd(old_wakeup_fd)
+            os.close(wake_r)
+            os.close(wake_w)
+
             # Emit DAEMON_STOPPED
             stopped_evt = make_event_envelope("BD_EVENT_DAEMON_STOPPED", {})
             self.sender.send(stopped_evt)
@@ -575,11 +990,39 @@ class ButtonDaemon:
                 except Exception:
                     pass
 
+            self.sender.close()
+
 
 # ------------------------------
 # Entry point
 # ------------------------------
 
+def set_realtime_priority() -> None:
+    """
+    Best-effort: run BD as a low SCHED_FIFO task pinned to the last core so
+    button wakeups are not delayed by audio/network load. Needs
+    CAP_SYS_NICE (or systemd CPUSchedulingPolicy=fifo); falls back to a
+    negative nice value, and finally to normal scheduling.
+    """
+    try:
+        os.sched_setaffinity(0, {(os.cpu_count() or 1) - 1})
+    except (AttributeError, OSError) as e:
+        logging.debug("BD: could not set CPU affinity: %s", e)
+
+    try:
+        os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(10))
+        logging.info("BD: running with SCHED_FIFO priority 10")
+        return
+    except (AttributeError, OSError) as e:
+        logging.debug("BD: SCHED_FIFO not available: %s", e)
+
+    try:
+        os.nice(-10)
+        logging.info("BD: running with nice -10")
+    except OSError as e:
+        logging.info("BD: keeping default scheduling (%s)", e)
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="HEARO Button Daemon (libgpiod 2.x)")
     parser.add_argument(
@@ -587,6 +1030,11 @@ def main() -> None:
         action="store_true",
         help="Enable debug logging",
     )
+    parser.add_argument(
+        "--no-realtime",
+        action="store_true",
+        help="Do not raise scheduling priority / pin to a CPU core",
+    )
     args = parser.parse_args()
 
     log_level = logging.DEBUG if args.debug else logging.INFO
@@ -594,6 +1042,10 @@ def main() -> None:
         level=log_level,
         format="%(asctime)s [%(levelname)s] %(message)s",
     )
+    refresh_debug_flag()
+
+    if not args.no_realtime:
+        set_realtime_priority()
 
     daemon = ButtonDaemon(debug=args.debug)
 
@@ -32,10 +32,15 @@ import sys
 import json
 import time
 import socket
-import select
+import selectors
 import signal
 import logging
-from typing import Dict, Any, Optional, Set
+from typing import Callable, Dict, Any, List, Optional, Set, Tuple
+
+try:
+    import orjson  # optional: faster IPC (de)serialisation
+except ImportError:
+    orjson = None
 
 # ---------------------------------------------------------------------------
 # Config
@@ -49,6 +54,9 @@ PLSM_CMD_SOCKET = "/tmp/hearo/psm_cmd.sock"  # NOTE: matches plsm daemon
 IPC_SCHEMA_EVENT = "hearo.ipc/event"
 IPC_SCHEMA_CMD = "hearo.ipc/cmd"
 
+# Cheap byte-level prefilter: datagrams without this marker are not events
+SCHEMA_MARKER = b'"' + IPC_SCHEMA_EVENT.encode() + b'"'
+
 HCSM_ORIGIN = "hcsm"
 
 # Required daemon-start events for leaving SYS_INIT
@@ -60,13 +68,123 @@ REQUIRED_DAEMON_EVENTS = {
     "PLSM_EVENT_DAEMON_STARTED": "plsm",
     "POWD_EVENT_DAEMON_STARTED": "powd",
 }
+REQUIRED_DAEMONS = frozenset(REQUIRED_DAEMON_EVENTS.values())
+
+# Events discarded while in SYS_INIT
+INIT_IGNORED_EVENTS = frozenset({
+    "NFC_EVENT_TAG_ADDED",
+    "NFC_EVENT_TAG_REMOVED",
+    "BD_EVENT_BUTTON",
+})
+
+# Events that drop the latched auth dimension
+AUTH_LOST_EVENTS = frozenset({
+    "PLSM_EVENT_AUTH_FAILED",
+    "PLSM_EVENT_AUTH_LOST",
+    "PLSM_EVENT_DISCONNECTED",
+})
+
+# Seek while NEXT/PREV is held: one step per HOLD_TICK / LONG_PRESS,
+# coalesced into at most one PLSM_COMMAND_SEEK per flush interval
+SEEK_STEP_MS = 15000
+SEEK_FLUSH_INTERVAL_MS = 1000
+
+# Max datagrams handled per wakeup of the event socket
+EVENT_BATCH_MAX = 32
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
 def epoch_ms() -> int:
-    return int(time.time() * 1000.0)
+    return time.time_ns() // 1_000_000
+
+
+def mono_ms() -> int:
+    """Monotonic ms for interval timing; immune to wall-clock steps."""
+    return time.monotonic_ns() // 1_000_000
+
+
+if orjson is not None:
+    def json_bytes(msg: Any) -> bytes:
+        return orjson.dumps(msg)
+
+    json_loads = orjson.loads
+else:
+    def json_bytes(msg: Any) -> bytes:
+        return json.dumps(msg, separators=(",", ":")).encode("utf-8")
+
+    json_loads = json.loads
+
+
+def sd_notify(state: bytes) -> bool:
+    """
+    Send a state update (e.g. b"READY=1") to systemd's $NOTIFY_SOCKET.
+    Returns False when not running under systemd or the send failed.
+    """
+    addr = os.environ.get("NOTIFY_SOCKET")
+    if not addr:
+        return False
+    if addr[0] == "@":
+        # abstract namespace socket
+        addr = "\0" + addr[1:]
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM | socket.SOCK_CLOEXEC) as s:
+            s.connect(addr)
+            s.sendall(state)
+    except OSError as e:
+        logging.debug("HCSM: sd_notify %r failed: %s", state, e)
+        return False
+    return True
+
+
+def watchdog_interval_ms() -> Optional[int]:
+    """Keepalive interval (half of $WATCHDOG_USEC) or None if disabled."""
+    try:
+        usec = int(os.environ.get("WATCHDOG_USEC", "0"))
+        pid = int(os.environ.get("WATCHDOG_PID") or os.getpid())
+    except ValueError:
+        logging.warning("HCSM: malformed WATCHDOG_USEC/WATCHDOG_PID, watchdog disabled")
+        return None
+    if usec <= 0 or pid != os.getpid():
+        return None
+    return max(1, usec // 2000)
+
+
+class DgramConnection:
+    """
+    Lazily connected, non-blocking AF_UNIX datagram socket to one path,
+    kept for the daemon lifetime. A connection that went stale because the
+    peer rebound its socket (daemon restart) is re-established and the
+    datagram retried once. send() raises OSError on failure.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.sock: Optional[socket.socket] = None
+
+    def send(self, data: bytes) -> None:
+        while True:
+            fresh = self.sock is None
+            try:
+                if fresh:
+                    s = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+                    s.setblocking(False)
+                    self.sock = s
+                    s.connect(self.path)
+                self.sock.send(data)
+                return
+            except BlockingIOError:
+                raise
+            except OSError:
+                self.close()
+                if fresh:
+                    raise
+
+    def close(self) -> None:
+        if self.sock is not None:
+            self.sock.close()
+            self.sock = None
 
 
 class EventSender:
@@ -74,23 +192,59 @@ class EventSender:
 
     def __init__(self, path: str) -> None:
         self.path = path
+        self.conn = DgramConnection(path)
+        # Pre-encoded envelopes for fixed (event, payload) pairs; only the
+        # id/ts numbers are filled in per send
+        self._templates: Dict[Tuple[str, Optional[str]], bytes] = {}
+
+    def _template(
+        self, key: Tuple[str, Optional[str]], event: str, payload: Dict[str, Any]
+    ) -> bytes:
+        tpl = self._templates.get(key)
+        if tpl is None:
+            tpl = (
+                b'{"schema":' + json_bytes(IPC_SCHEMA_EVENT)
+                + b',"v":1,"id":"evt-hcsm-%d","ts":%d,"event":'
+                + json_bytes(event).replace(b"%", b"%%")
+                + b',"payload":'
+                + json_bytes(payload).replace(b"%", b"%%")
+                + b"}"
+            )
+            self._templates[key] = tpl
+        return tpl
+
+    def _send(self, event: str, data: bytes) -> None:
+        try:
+            self.conn.send(data)
+        except OSError as e:
+            logging.error("HCSM: failed to send event %s: %s", event, e)
+
+    def send_state_changed(self, state: str) -> None:
+        """HCSM_EVENT_STATE_CHANGED for one of the few HcsmState values."""
+        event = "HCSM_EVENT_STATE_CHANGED"
+        ts = epoch_ms()
+        tpl = self._template((event, state), event, {"state": state})
+        self._send(event, tpl % (ts, ts))
 
     def send_event(self, event: str, payload: Dict[str, Any]) -> None:
+        if not payload:
+            ts = epoch_ms()
+            self._send(event, self._template((event, None), event, {}) % (ts, ts))
+            return
+
+        now = epoch_ms()
         env = {
             "schema": IPC_SCHEMA_EVENT,
             "v": 1,
-            "id": f"evt-hcsm-{epoch_ms()}",
-            "ts": epoch_ms(),
+            "id": f"evt-hcsm-{now}",
+            "ts": now,
             "event": event,
             "payload": payload or {},
         }
-        data = json.dumps(env, separators=(",", ":")).encode("utf-8")
-        try:
-            with socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM) as s:
-                s.connect(self.path)
-                s.send(data)
-        except OSError as e:
-            logging.error("HCSM: failed to send event %s: %s", event, e)
+        self._send(event, json_bytes(env))
+
+    def close(self) -> None:
+        self.conn.close()
 
 
 class CommandClient:
@@ -99,6 +253,36 @@ class CommandClient:
     def __init__(self, path: str, origin: str = HCSM_ORIGIN) -> None:
         self.path = path
         self.origin = origin
+        self.conn = DgramConnection(path)
+        # Pre-encoded envelopes for payload-less commands, keyed by name
+        self._templates: Dict[str, bytes] = {}
+
+    def _send(self, cmd_name: str, data: bytes) -> None:
+        try:
+            self.conn.send(data)
+        except OSError as e:
+            logging.error(
+                "HCSM: failed to send cmd %s to %s: %s",
+                cmd_name,
+                self.path,
+                e,
+            )
+
+    def send_cmd_cached(self, cmd_name: str) -> None:
+        """send_cmd(cmd_name) with an empty payload, from a cached template."""
+        tpl = self._templates.get(cmd_name)
+        if tpl is None:
+            tpl = (
+                b'{"schema":' + json_bytes(IPC_SCHEMA_CMD)
+                + b',"v":1,"id":"cmd-hcsm-%d","ts":%d,"cmd":'
+                + json_bytes(cmd_name).replace(b"%", b"%%")
+                + b',"payload":{},"reply":"","origin":'
+                + json_bytes(self.origin).replace(b"%", b"%%")
+                + b',"timeout_ms":1000}'
+            )
+            self._templates[cmd_name] = tpl
+        now = epoch_ms()
+        self._send(cmd_name, tpl % (now, now))
 
     def send_cmd(
         self,
@@ -106,30 +290,23 @@ class CommandClient:
         payload: Optional[Dict[str, Any]] = None,
         timeout_ms: int = 1000,
     ) -> None:
-        cmd_id = f"cmd-hcsm-{epoch_ms()}"
+        now = epoch_ms()
+        cmd_id = f"cmd-hcsm-{now}"
         env = {
             "schema": IPC_SCHEMA_CMD,
             "v": 1,
             "id": cmd_id,
-            "ts": epoch_ms(),
+            "ts": now,
             "cmd": cmd_name,
             "payload": payload or {},
             "reply": "",          # HCSM does not handle cmd replies
             "origin": self.origin,
             "timeout_ms": timeout_ms,
         }
-        data = json.dumps(env, separators=(",", ":")).encode("utf-8")
-        try:
-            with socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM) as s:
-                s.connect(self.path)
-                s.send(data)
-        except OSError as e:
-            logging.error(
-                "HCSM: failed to send cmd %s to %s: %s",
-                cmd_name,
-                self.path,
-                e,
-            )
+        self._send(cmd_name, json_bytes(env))
+
+    def close(self) -> None:
+        self.conn.close()
 
 
 class EventServer:
@@ -138,6 +315,10 @@ class EventServer:
 
     This version assumes systemd socket activation (hearo-events.socket)
     and will ONLY use the inherited fd. If no fd is provided, it exits.
+
+    Burst capacity of an AF_UNIX datagram socket is bounded by the number
+    of queued datagrams (sysctl net.unix.max_dgram_qlen, default 10), not
+    by SO_RCVBUF. Raise that sysctl if senders report a full queue.
     """
 
     def __init__(self, path: str) -> None:
@@ -166,14 +347,22 @@ class EventServer:
         )
         sys.exit(1)
 
-    def recv(self) -> Optional[bytes]:
+    def recv_batch(self, max_msgs: int = EVENT_BATCH_MAX) -> List[bytes]:
+        """
+        Drain up to max_msgs queued datagrams in one wakeup. Bursts (all
+        daemons starting, button storms) then cost one selector round trip
+        instead of one per event.
+        """
+        batch: List[bytes] = []
         if not self.sock:
-            return None
+            return batch
+        recv = self.sock.recv
         try:
-            data, _ = self.sock.recvfrom(65535)
-            return data
+            for _ in range(max_msgs):
+                batch.append(recv(65535))
         except BlockingIOError:
-            return None
+            pass
+        return batch
 
     def fileno(self) -> int:
         if not self.sock:
@@ -218,22 +407,79 @@ class HcsmDaemon:
         self.auth_ok: bool = False
 
         self.initiated_emitted: bool = False
+
+        # STATE_CHANGED is sent once per batch of events, for the final state
+        self.state_dirty: bool = False
+        self.last_emitted_state: Optional[str] = None
         self.current_tag_uid: Optional[str] = None
 
+        # Accumulated seek delta not yet sent to PLSM
+        self.pending_seek_ms: int = 0
+        self.last_seek_flush_ms: int = 0
+
+        # Event-driven states: event name -> handler(payload).
+        # Events missing from a state's table are ignored in that state.
+        # SYS_INIT and SYS_ERROR react to any event (see handle_raw_event).
+        battery_critical = self._on_battery_critical
+        self._dispatch: Dict[str, Dict[str, Callable[[Dict[str, Any]], None]]] = {
+            HcsmState.SYS_NO_WIFI: {
+                "WSM_EVENT_WIFI_CONNECTED": self._on_wifi_connected,
+                "POWD_EVENT_BATTERY_CRITICAL": battery_critical,
+            },
+            HcsmState.SYS_OFFLINE: {
+                "PLSM_EVENT_AUTHENTICATED": self._go_ready_paused,
+                "WSM_EVENT_WIFI_LOST": self._go_no_wifi,
+                "POWD_EVENT_BATTERY_CRITICAL": battery_critical,
+            },
+            HcsmState.SYS_READY_PAUSED: {
+                "NFC_EVENT_TAG_ADDED": self._on_tag_added,
+                "PLSM_EVENT_TAG_RESOLVED": self._go_playing,
+                "WSM_EVENT_WIFI_LOST": self._go_no_wifi,
+                "PLSM_EVENT_DISCONNECTED": self._go_offline,
+                "PLSM_EVENT_AUTH_LOST": self._go_offline,
+                "PLSM_EVENT_AUTH_FAILED": self._go_offline,
+                "POWD_EVENT_BATTERY_CRITICAL": battery_critical,
+            },
+            HcsmState.SYS_PLAYING: {
+                "NFC_EVENT_TAG_ADDED": self._on_tag_added,
+                "PLSM_EVENT_PLAY_STOPPED": self._go_ready_paused,
+                "NFC_EVENT_TAG_REMOVED": self._on_tag_removed_playing,
+                "BD_EVENT_BUTTON": self._handle_button_in_playing,
+                "WSM_EVENT_WIFI_LOST": self._on_wifi_lost_playing,
+                "PLSM_EVENT_DISCONNECTED": self._go_offline,
+                "PLSM_EVENT_AUTH_LOST": self._go_offline,
+                "PLSM_EVENT_AUTH_FAILED": self._go_offline,
+                "POWD_EVENT_BATTERY_CRITICAL": battery_critical,
+            },
+            HcsmState.SYS_SHUTDOWN: {},
+        }
+
     # ----------------- state + events -----------------
 
     def _emit_state_changed(self) -> None:
-        self.sender.send_event("HCSM_EVENT_STATE_CHANGED", {"state": self.state})
+        self.state_dirty = False
+        self.last_emitted_state = self.state
+        self.sender.send_state_changed(self.state)
+
+    def flush_state_changed(self) -> None:
+        """Emit the deferred STATE_CHANGED, unless the state flapped back."""
+        if self.state_dirty:
+            if self.state != self.last_emitted_state:
+                self._emit_state_changed()
+            else:
+                self.state_dirty = False
 
     def _transition(self, new_state: str) -> None:
         if new_state == self.state:
             return
         logging.info("HCSM: state %s -> %s", self.state, new_state)
         self.state = new_state
-        self._emit_state_changed()
 
         if self.state == HcsmState.SYS_SHUTDOWN:
+            self._emit_state_changed()
             self.sender.send_event("HCSM_EVENT_SHUTDOWN", {})
+        else:
+            self.state_dirty = True
 
     def _handle_daemon_started(self, event: str) -> None:
         if event in REQUIRED_DAEMON_EVENTS:
@@ -243,7 +489,7 @@ class HcsmDaemon:
                 logging.info("HCSM: daemon started: %s", name)
 
     def _all_daemons_started(self) -> bool:
-        return set(REQUIRED_DAEMON_EVENTS.values()).issubset(self.daemons_started)
+        return self.daemons_started >= REQUIRED_DAEMONS
 
     # ----------------- input latching -----------------
 
@@ -257,18 +503,17 @@ class HcsmDaemon:
         # Auth dimension
         if event == "PLSM_EVENT_AUTHENTICATED":
             self.auth_ok = True
-        elif event in (
-            "PLSM_EVENT_AUTH_FAILED",
-            "PLSM_EVENT_AUTH_LOST",
-            "PLSM_EVENT_DISCONNECTED",
-        ):
+        elif event in AUTH_LOST_EVENTS:
             self.auth_ok = False
 
     # ----------------- main event entry -----------------
 
     def handle_raw_event(self, raw: bytes) -> None:
+        if SCHEMA_MARKER not in raw:
+            return
+
         try:
-            msg = json.loads(raw.decode("utf-8"))
+            msg = json_loads(raw)
         except Exception as e:
             logging.warning("HCSM: invalid JSON event: %s", e)
             return
@@ -288,18 +533,13 @@ class HcsmDaemon:
         self._update_input_dimensions(event)
 
         # 3) State-specific handling
-        if self.state == HcsmState.SYS_INIT:
+        table = self._dispatch.get(self.state)
+        if table is not None:
+            handler = table.get(event)
+            if handler is not None:
+                handler(payload)
+        elif self.state == HcsmState.SYS_INIT:
             self._handle_init_event(event, payload)
-        elif self.state == HcsmState.SYS_NO_WIFI:
-            self._handle_no_wifi_event(event, payload)
-        elif self.state == HcsmState.SYS_OFFLINE:
-            self._handle_offline_event(event, payload)
-        elif self.state == HcsmState.SYS_READY_PAUSED:
-            self._handle_ready_paused_event(event, payload)
-        elif self.state == HcsmState.SYS_PLAYING:
-            self._handle_playing_event(event, payload)
-        elif self.state == HcsmState.SYS_SHUTDOWN:
-            return
         elif self.state == HcsmState.SYS_ERROR:
             self._handle_error_event(event, payload)
 
@@ -307,7 +547,7 @@ class HcsmDaemon:
 
     def _handle_init_event(self, event: str, payload: Dict[str, Any]) -> None:
         # discard NFC + button during INIT
-        if event in ("NFC_EVENT_TAG_ADDED", "NFC_EVENT_TAG_REMOVED", "BD_EVENT_BUTTON"):
+        if event in INIT_IGNORED_EVENTS:
             return
 
         # Once all daemons are up, choose initial system state using latched inputs
@@ -321,113 +561,47 @@ class HcsmDaemon:
                 self._transition(HcsmState.SYS_NO_WIFI)
 
             if not self.initiated_emitted:
+                # Announce the initial state before INITIATED
+                self.flush_state_changed()
                 self.sender.send_event("HCSM_EVENT_INITIATED", {})
                 self.initiated_emitted = True
 
-    def _handle_no_wifi_event(self, event: str, payload: Dict[str, Any]) -> None:
-        if event == "WSM_EVENT_WIFI_CONNECTED":
-            # Auth may already be OK by the time Wi-Fi comes up
-            if self.auth_ok:
-                self._transition(HcsmState.SYS_READY_PAUSED)
-            else:
-                self._transition(HcsmState.SYS_OFFLINE)
-            return
-
-        if event == "POWD_EVENT_BATTERY_CRITICAL":
-            self._cmd_stop_playback()
-            self._transition(HcsmState.SYS_SHUTDOWN)
-            return
-
-    def _handle_offline_event(self, event: str, payload: Dict[str, Any]) -> None:
-        if event == "PLSM_EVENT_AUTHENTICATED":
-            self._transition(HcsmState.SYS_READY_PAUSED)
-            return
+    def _go_no_wifi(self, payload: Dict[str, Any]) -> None:
+        self._transition(HcsmState.SYS_NO_WIFI)
 
-        if event in ("PLSM_EVENT_AUTH_FAILED", "PLSM_EVENT_AUTH_LOST"):
-            return
+    def _go_offline(self, payload: Dict[str, Any]) -> None:
+        self._transition(HcsmState.SYS_OFFLINE)
 
-        if event == "WSM_EVENT_WIFI_LOST":
-            self._transition(HcsmState.SYS_NO_WIFI)
-            return
+    def _go_ready_paused(self, payload: Dict[str, Any]) -> None:
+        self._transition(HcsmState.SYS_READY_PAUSED)
 
-        if event == "POWD_EVENT_BATTERY_CRITICAL":
-            self._cmd_stop_playback()
-            self._transition(HcsmState.SYS_SHUTDOWN)
-            return
+    def _go_playing(self, payload: Dict[str, Any]) -> None:
+        self._transition(HcsmState.SYS_PLAYING)
 
-    def _handle_ready_paused_event(self, event: str, payload: Dict[str, Any]) -> None:
-        if event == "NFC_EVENT_TAG_ADDED":
-            uid = payload.get("uid")
-            if isinstance(uid, str):
-                self.current_tag_uid = uid
-                self.plsm.send_cmd("PLSM_COMMAND_PLAY_TAG", {"uid": uid})
-            return
-
-        if event == "PLSM_EVENT_TAG_RESOLVED":
-            self._transition(HcsmState.SYS_PLAYING)
-            return
-
-        if event == "PLSM_EVENT_TAG_UNKNOWN":
-            return
-
-        if event == "WSM_EVENT_WIFI_LOST":
-            self._transition(HcsmState.SYS_NO_WIFI)
-            return
-
-        if event in (
-            "PLSM_EVENT_DISCONNECTED",
-            "PLSM_EVENT_AUTH_LOST",
-            "PLSM_EVENT_AUTH_FAILED",
-        ):
-            self._transition(HcsmState.SYS_OFFLINE)
-            return
-
-        if event == "POWD_EVENT_BATTERY_CRITICAL":
-            self._cmd_stop_playback()
-            self._transition(HcsmState.SYS_SHUTDOWN)
-            return
-
-    def _handle_playing_event(self, event: str, payload: Dict[str, Any]) -> None:
-        if event == "NFC_EVENT_TAG_ADDED":
-            uid = payload.get("uid")
-            if isinstance(uid, str):
-                self.current_tag_uid = uid
-                self.plsm.send_cmd("PLSM_COMMAND_PLAY_TAG", {"uid": uid})
-            return
-
-        if event == "PLSM_EVENT_TAG_UNKNOWN":
-            return
-
-        if event == "PLSM_EVENT_PLAY_STOPPED":
+    def _on_wifi_connected(self, payload: Dict[str, Any]) -> None:
+        # Auth may already be OK by the time Wi-Fi comes up
+        if self.auth_ok:
             self._transition(HcsmState.SYS_READY_PAUSED)
-            return
-
-        if event == "NFC_EVENT_TAG_REMOVED":
-            self._cmd_stop_playback()
-            self._transition(HcsmState.SYS_READY_PAUSED)
-            return
-
-        if event == "BD_EVENT_BUTTON":
-            self._handle_button_in_playing(payload)
-            return
+        else:
+            self._transition(HcsmState.SYS_OFFLINE)
 
-        if event == "WSM_EVENT_WIFI_LOST":
-            self._cmd_stop_playback()
-            self._transition(HcsmState.SYS_NO_WIFI)
-            return
+    def _on_tag_added(self, payload: Dict[str, Any]) -> None:
+        uid = payload.get("uid")
+        if isinstance(uid, str):
+            self.current_tag_uid = uid
+            self.plsm.send_cmd("PLSM_COMMAND_PLAY_TAG", {"uid": uid})
 
-        if event == "PLSM_EVENT_DISCONNECTED":
-            self._transition(HcsmState.SYS_OFFLINE)
-            return
+    def _on_tag_removed_playing(self, payload: Dict[str, Any]) -> None:
+        self._cmd_stop_playback()
+        self._transition(HcsmState.SYS_READY_PAUSED)
 
-        if event in ("PLSM_EVENT_AUTH_LOST", "PLSM_EVENT_AUTH_FAILED"):
-            self._transition(HcsmState.SYS_OFFLINE)
-            return
+    def _on_wifi_lost_playing(self, payload: Dict[str, Any]) -> None:
+        self._cmd_stop_playback()
+        self._transition(HcsmState.SYS_NO_WIFI)
 
-        if event == "POWD_EVENT_BATTERY_CRITICAL":
-            self._cmd_stop_playback()
-            self._transition(HcsmState.SYS_SHUTDOWN)
-            return
+    def _on_battery_critical(self, payload: Dict[str, Any]) -> None:
+        self._cmd_stop_playback()
+        self._transition(HcsmState.SYS_SHUTDOWN)
 
     def _handle_error_event(self, event: str, payload: Dict[str, Any]) -> None:
         if self._all_daemons_started():
@@ -436,7 +610,7 @@ class HcsmDaemon:
     # ----------------- helpers -----------------
 
     def _cmd_stop_playback(self) -> None:
-        self.plsm.send_cmd("PLSM_COMMAND_STOP", {})
+        self.plsm.send_cmd_cached("PLSM_COMMAND_STOP")
 
     def _handle_button_in_playing(self, payload: Dict[str, Any]) -> None:
         button = payload.get("button")
@@ -445,11 +619,24 @@ class HcsmDaemon:
             return
 
         if button == "NEXT" and interaction == "SHORT_PRESS":
-            self.plsm.send_cmd("PLSM_COMMAND_NEXT", {})
+            self.plsm.send_cmd_cached("PLSM_COMMAND_NEXT")
         elif button == "PREV" and interaction == "SHORT_PRESS":
-            self.plsm.send_cmd("PLSM_COMMAND_PREVIOUS", {})
+            self.plsm.send_cmd_cached("PLSM_COMMAND_PREVIOUS")
         elif button in ("NEXT", "PREV") and interaction in ("LONG_PRESS", "HOLD_TICK"):
-            delta_ms = 15000 if button == "NEXT" else -15000
+            self.pending_seek_ms += SEEK_STEP_MS if button == "NEXT" else -SEEK_STEP_MS
+            # LONG_PRESS ends the hold; otherwise flush at most once per interval
+            if interaction == "LONG_PRESS" or self._seek_flush_due():
+                self._flush_seek()
+
+    def _seek_flush_due(self) -> bool:
+        return mono_ms() - self.last_seek_flush_ms >= SEEK_FLUSH_INTERVAL_MS
+
+    def _flush_seek(self) -> None:
+        delta_ms = self.pending_seek_ms
+        self.pending_seek_ms = 0
+        self.last_seek_flush_ms = mono_ms()
+        # Steps left over from a previous PLAYING session are dropped
+        if delta_ms and self.state == HcsmState.SYS_PLAYING:
             self.plsm.send_cmd("PLSM_COMMAND_SEEK", {"delta_ms": delta_ms})
 
     # ----------------- lifecycle -----------------
@@ -460,22 +647,68 @@ class HcsmDaemon:
         # Initial request; if it fails, we just rely on events later.
         self.wsm.send_cmd("WSM_COMMAND_STATUS", {})
         self._emit_state_changed()
+        # Event socket is live and the initial state is out
+        sd_notify(b"READY=1")
+
+    def _seek_flush_timeout(self) -> Optional[float]:
+        """Seconds until the pending seek must be flushed; None if none."""
+        if not self.pending_seek_ms:
+            return None
+        due_ms = self.last_seek_flush_ms + SEEK_FLUSH_INTERVAL_MS
+        return max(0, due_ms - mono_ms()) / 1000.0
 
     def run(self) -> None:
-        while self.running:
-            try:
-                rlist, _, _ = select.select([self.event_server.fileno()], [], [], 0.5)
-            except (OSError, ValueError):
-                rlist = []
+        # Signals write to this pipe so they end the (otherwise unbounded)
+        # wait immediately; see signal.set_wakeup_fd
+        wake_r, wake_w = os.pipe2(os.O_NONBLOCK | os.O_CLOEXEC)
+        old_wakeup_fd = signal.set_wakeup_fd(wake_w)
 
-            if rlist:
-                raw = self.event_server.recv()
-                if raw:
-                    self.handle_raw_event(raw)
+        sel = selectors.DefaultSelector()
+        sel.register(self.event_server.fileno(), selectors.EVENT_READ, "events")
+        sel.register(wake_r, selectors.EVENT_READ, "wake")
+
+        wd_interval_ms = watchdog_interval_ms()
+        wd_next_ms = 0
+
+        try:
+            while self.running:
+                timeout = self._seek_flush_timeout()
+                if wd_interval_ms is not None:
+                    now_ms = mono_ms()
+                    if now_ms >= wd_next_ms:
+                        sd_notify(b"WATCHDOG=1")
+                        wd_next_ms = now_ms + wd_interval_ms
+                    wd_timeout = (wd_next_ms - now_ms) / 1000.0
+                    if timeout is None or wd_timeout < timeout:
+                        timeout = wd_timeout
+
+                for key, _mask in sel.select(timeout=timeout):
+                    if key.data == "events":
+                        for raw in self.event_server.recv_batch():
+                            self.handle_raw_event(raw)
+                        self.flush_state_changed()
+                    else:
+                        try:
+                            while os.read(wake_r, 64):
+                                pass
+                        except BlockingIOError:
+                            pass
+
+                if self.pending_seek_ms and self._seek_flush_due():
+                    self._flush_seek()
+        finally:
+            sd_notify(b"STOPPING=1")
+            sel.close()
+            signal.set_wakeup_fd(old_wakeup_fd)
+            os.close(wake_r)
+            os.close(wake_w)
+            self.event_server.close()
+            self.sender.close()
+            self.wsm.close()
+            self.plsm.close()
 
     def stop(self) -> None:
         self.running = False
-        self.event_server.close()
 
 
 # ---------------------------------------------------------------------------
@@ -1,5 +1,17 @@
 #!/usr/bin/env python3
-import socket, json, os
+import socket, json, os, sys
+
+try:
+    import orjson
+    loads = orjson.loads
+
+    def dumps_pretty(msg):
+        return orjson.dumps(msg, option=orjson.OPT_INDENT_2)
+except ImportError:
+    loads = json.loads
+
+    def dumps_pretty(msg):
+        return json.dumps(msg, indent=2).encode("utf-8")
 
 EVENT_SOCKET = "/tmp/hearo/events.sock"
 
@@ -8,13 +20,15 @@ if os.path.exists(EVENT_SOCKET):
 
 sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
 sock.bind(EVENT_SOCKET)
-print("Listening on", EVENT_SOCKET)
+print("Listening on", EVENT_SOCKET, flush=True)
 
+out = sys.stdout.buffer
 while True:
-    data, _ = sock.recvfrom(8192)
+    data, _ = sock.recvfrom(65535)
     try:
-        msg = json.loads(data.decode("utf-8"))
+        msg = loads(data)
     except Exception as e:
-        print("INVALID:", e, data)
+        print("INVALID:", e, data, flush=True)
     else:
-        print(json.dumps(msg, indent=2))
+        out.write(dumps_pretty(msg) + b"\n")
+        out.flush()
@@ -16,11 +16,17 @@ import signal
 import logging
 import socket
 import selectors
+from collections import deque
 from dataclasses import dataclass
 from typing import Optional, Literal, Dict, Any
 
 from rpi_ws281x import PixelStrip, Color
 
+try:
+    import orjson  # optional: faster IPC (de)serialisation
+except ImportError:
+    orjson = None
+
 # ---------------------------------------------------------------------------
 # Config
 # ---------------------------------------------------------------------------
@@ -31,7 +37,7 @@ EVENT_SOCKET_PATH = "/tmp/hearo/events.sock"
 IPC_SCHEMA_EVENT = "hearo.ipc/event"
 
 TICK_HZ = 30.0
-TICK_INTERVAL = 1.0 / TICK_HZ
+TICK_INTERVAL_NS = int(1_000_000_000 / TICK_HZ)
 
 LED_COUNT = 1          # set to actual number later
 LED_PIN = 12           # GPIO12 (PWM1 CH0)
@@ -81,6 +87,8 @@ class DaemonState:
     feedback: Optional[Animation]
     error_active: bool
     error_start_ms: Optional[int] = None
+    # Set by every command; a static frame is only recomputed when set
+    dirty: bool = True
 
 
 # ---------------------------------------------------------------------------
@@ -109,12 +117,18 @@ class LedDriver:
             self.strip.setPixelColor(i, Color(0, 0, 0))
         self.strip.show()
         time.sleep(0.02)
+        self.last_color = Color(0, 0, 0)
 
     def show_color(self, r: int, g: int, b: int):
         c = Color(r, g, b)
+        # The strip latches its last frame; re-sending it changes nothing
+        if c == self.last_color:
+            return
+        set_pixel = self.strip.setPixelColor
         for i in range(self.led_count):
-            self.strip.setPixelColor(i, c)
+            set_pixel(i, c)
         self.strip.show()
+        self.last_color = c
         logging.debug("LED -> (%3d,%3d,%3d)", r, g, b)
 
     def off(self):
@@ -130,7 +144,19 @@ def clamp(v, lo, hi):
 
 
 def now_ms():
-    return int(time.monotonic() * 1000)
+    return time.monotonic_ns() // 1_000_000
+
+
+if orjson is not None:
+    def json_bytes(msg: Any) -> bytes:
+        return orjson.dumps(msg)
+
+    json_loads = orjson.loads
+else:
+    def json_bytes(msg: Any) -> bytes:
+        return json.dumps(msg, separators=(",", ":")).encode("utf-8")
+
+    json_loads = json.loads
 
 
 def hsv_to_rgb(h, s, v) -> RGB:
@@ -158,10 +184,28 @@ def hsv_to_rgb(h, s, v) -> RGB:
     return RGB(int(r * 255), int(g * 255), int(b * 255))
 
 
+# Error rainbow: saturation and value are fixed, so one hue step per entry
+# (~28 ms at ERROR_PERIOD_MS) is finer than the tick interval
+ERROR_LUT_SIZE = 360
+ERROR_LUT = [
+    hsv_to_rgb(i / ERROR_LUT_SIZE, 1.0, ERROR_BRIGHTNESS / 255.0)
+    for i in range(ERROR_LUT_SIZE)
+]
+
+
 # ---------------------------------------------------------------------------
 # Animation
 # ---------------------------------------------------------------------------
 
+# Smooth wave 0.5 - 0.5*cos(2*pi*phase); 1024 steps are well below one
+# 8-bit brightness level apart
+SMOOTH_LUT_SIZE = 1024
+SMOOTH_LUT = [
+    0.5 - 0.5 * math.cos(2 * math.pi * i / SMOOTH_LUT_SIZE)
+    for i in range(SMOOTH_LUT_SIZE)
+]
+
+
 def compute_wave_factor(anim: Animation, t_ms: int) -> float:
     if anim.mode == "steady":
         return 1.0
@@ -182,7 +226,7 @@ def compute_wave_factor(anim: Animation, t_ms: int) -> float:
         return clamp(1 - (elapsed / period), 0.0, 1.0)
 
     # smooth
-    return 0.5 - 0.5 * math.cos(2 * math.pi * phase)
+    return SMOOTH_LUT[int(phase * SMOOTH_LUT_SIZE)]
 
 
 def expire_feedback(state: DaemonState, t_ms: int):
@@ -196,14 +240,21 @@ def expire_feedback(state: DaemonState, t_ms: int):
         state.feedback = None
 
 
+def is_static(state: DaemonState) -> bool:
+    """True if the frame cannot change until the next command."""
+    return (
+        not state.error_active
+        and state.feedback is None
+        and state.current_state.mode == "steady"
+    )
+
+
 def compute_active_rgb(state: DaemonState, t_ms: int) -> RGB:
     if state.error_active:
         if state.error_start_ms is None:
             state.error_start_ms = t_ms
         elapsed = (t_ms - state.error_start_ms) % ERROR_PERIOD_MS
-        hue = elapsed / ERROR_PERIOD_MS
-        val = ERROR_BRIGHTNESS / 255.0
-        return hsv_to_rgb(hue, 1.0, val)
+        return ERROR_LUT[elapsed * ERROR_LUT_SIZE // ERROR_PERIOD_MS]
 
     expire_feedback(state, t_ms)
     anim = state.feedback if state.feedback else state.current_state
@@ -225,21 +276,24 @@ def compute_active_rgb(state: DaemonState, t_ms: int) -> RGB:
 class EventSender:
     def __init__(self, path: str):
         self.path = path
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        self.sock.setblocking(False)
 
     def send_event(self, event: str, payload: Dict[str, Any]):
+        now = now_ms()
         env = {
             "schema": IPC_SCHEMA_EVENT,
             "v": 1,
-            "id": f"evt-ledd-{now_ms()}",
-            "ts": now_ms(),
+            "id": f"evt-ledd-{now}",
+            "ts": now,
             "event": event,
             "payload": payload or {},
         }
-        data = json.dumps(env, separators=(",", ":")).encode("utf-8")
+        data = json_bytes(env)
         try:
-            with socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM) as s:
-                s.connect(self.path)
-                s.send(data)
+            self.sock.sendto(data, self.path)
+        except BlockingIOError:
+            logging.warning("LEDD: event queue full, dropping event %s", event)
         except OSError as e:
             logging.warning("LEDD: failed to send event %s: %s", event, e)
 
@@ -286,9 +340,8 @@ class IpcServer:
             return
 
         try:
-            txt = data.decode("utf-8")
-            logging.debug("IPC: raw data: %r", txt)
-            msg = json.loads(txt)
+            logging.debug("IPC: raw data: %r", data)
+            msg = json_loads(data)
             IPC_MESSAGE_QUEUE.append(msg)
         except Exception as e:
             logging.warning("IPC: bad JSON: %s", e)
@@ -316,19 +369,31 @@ class IpcServer:
             os.unlink(self.path)
 
 
-IPC_MESSAGE_QUEUE: list[Dict[str, Any]] = []
+IPC_MESSAGE_QUEUE: deque[Dict[str, Any]] = deque()
 
 
 # ---------------------------------------------------------------------------
 # ACK / RESULT
 # ---------------------------------------------------------------------------
 
-def send_reply(path: str, payload: Dict[str, Any]):
+# Only id and ts vary between ACKs
+ACK_TEMPLATES = {
+    True: b'{"schema":"hearo.ipc/ack","id":%b,"ok":true,"ts":%d}',
+    False: b'{"schema":"hearo.ipc/ack","id":%b,"ok":false,"ts":%d}',
+}
+
+
+# One unbound datagram socket serves every reply path; a reader that is
+# not keeping up gets its reply dropped instead of stalling the tick loop
+_REPLY_SOCK = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+_REPLY_SOCK.setblocking(False)
+
+
+def send_reply(path: str, data: bytes):
     try:
-        s = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-        s.connect(path)
-        s.sendall(json.dumps(payload).encode("utf-8"))
-        s.close()
+        _REPLY_SOCK.sendto(data, path)
+    except BlockingIOError:
+        logging.warning("IPC: reply queue of %s full, dropping reply", path)
     except Exception as e:
         logging.warning("IPC: failed to send reply to %s: %s", path, e)
 
@@ -337,25 +402,21 @@ def send_ack(msg: Dict[str, Any], ok: bool = True):
     reply = msg.get("reply")
     if not reply:
         return
-    send_reply(reply, {
-        "schema": "hearo.ipc/ack",
-        "id": msg.get("id"),
-        "ok": ok,
-        "ts": now_ms()
-    })
+    msg_id = json_bytes(msg.get("id"))
+    send_reply(reply, ACK_TEMPLATES[ok] % (msg_id, now_ms()))
 
 
 def send_result(msg: Dict[str, Any], payload: Dict[str, Any]):
     reply = msg.get("reply")
     if not reply:
         return
-    send_reply(reply, {
+    send_reply(reply, json_bytes({
         "schema": "hearo.ipc/result",
         "id": msg.get("id"),
         "ok": True,
         "payload": payload,
         "ts": now_ms()
-    })
+    }))
 
 
 # ---------------------------------------------------------------------------
@@ -377,6 +438,7 @@ def parse_rgb(d) -> Optional[RGB]:
 
 def handle_cmd(msg: Dict[str, Any], state: DaemonState):
     logging.info("CMD: %s", msg.get("cmd"))
+    state.dirty = True
     if msg.get("schema") != "hearo.ipc/cmd":
         send_ack(msg, False)
         return
@@ -484,23 +546,26 @@ def main():
     sender = EventSender(EVENT_SOCKET_PATH)
     sender.send_event("LEDD_EVENT_DAEMON_STARTED", {})
 
-    last_tick = time.monotonic()
+    last_tick = time.monotonic_ns()
 
     try:
         while RUNNING:
             ipc.poll()
 
             while IPC_MESSAGE_QUEUE:
-                msg = IPC_MESSAGE_QUEUE.pop(0)
+                msg = IPC_MESSAGE_QUEUE.popleft()
                 handle_cmd(msg, state)
 
-            now = time.monotonic()
-            if now - last_tick < TICK_INTERVAL:
-                time.sleep(TICK_INTERVAL - (now - last_tick))
+            now = time.monotonic_ns()
+            if now - last_tick < TICK_INTERVAL_NS:
+                time.sleep((TICK_INTERVAL_NS - (now - last_tick)) / 1e9)
                 continue
             last_tick = now
 
-            rgb = compute_active_rgb(state, now_ms())
+            if is_static(state) and not state.dirty:
+                continue
+            state.dirty = False
+            rgb = compute_active_rgb(state, now // 1_000_000)
             driver.show_color(rgb.r, rgb.g, rgb.b)
 
     finally:
@@ -17,9 +17,8 @@ def send_cmd(cmd, payload=None, msg_id=None):
     # prepare reply socket listener
     if os.path.exists(REPLY_SOCKET):
         os.unlink(REPLY_SOCKET)
-    rep = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    rep = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
     rep.bind(REPLY_SOCKET)
-    rep.listen(1)
 
     msg = {
         "schema": "hearo.ipc/cmd",
@@ -38,9 +37,7 @@ def send_cmd(cmd, payload=None, msg_id=None):
     c.close()
 
     # read single response (ACK or RESULT)
-    conn, _ = rep.accept()
-    resp = conn.recv(4096).decode()
-    conn.close()
+    resp = rep.recv(4096).decode()
     rep.close()
     print("RESPONSE:", resp)
 